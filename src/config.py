@@ -67,19 +67,30 @@ class Config:
         scale_factor = min(cls.SCREEN_WIDTH / cls.BASE_WIDTH, cls.SCREEN_HEIGHT / cls.BASE_HEIGHT)
         return int(size * scale_factor)
     
+    # Cache of derived dimensions keyed by the screen size they were
+    # computed for; a window resize changes SCREEN_WIDTH/HEIGHT and
+    # therefore misses the cache and recomputes
+    _scaled_cache = {}
+
     @classmethod
     def get_scaled_button_dimensions(cls):
-        """Get scaled button dimensions"""
-        return (
-            cls.scale_width(cls.BUTTON_WIDTH),
-            cls.scale_height(cls.BUTTON_HEIGHT)
-        )
-    
+        """Get scaled button dimensions (cached per display size)"""
+        key = ('button', cls.SCREEN_WIDTH, cls.SCREEN_HEIGHT)
+        if key not in cls._scaled_cache:
+            cls._scaled_cache[key] = (
+                cls.scale_width(cls.BUTTON_WIDTH),
+                cls.scale_height(cls.BUTTON_HEIGHT)
+            )
+        return cls._scaled_cache[key]
+
     @classmethod
     def get_scaled_font_sizes(cls):
-        """Get scaled font sizes"""
-        return {
-            'small': cls.scale_font(cls.FONT_SMALL),
-            'medium': cls.scale_font(cls.FONT_MEDIUM),
-            'large': cls.scale_font(cls.FONT_LARGE)
-        } 
\ No newline at end of file
+        """Get scaled font sizes (cached per display size)"""
+        key = ('fonts', cls.SCREEN_WIDTH, cls.SCREEN_HEIGHT)
+        if key not in cls._scaled_cache:
+            cls._scaled_cache[key] = {
+                'small': cls.scale_font(cls.FONT_SMALL),
+                'medium': cls.scale_font(cls.FONT_MEDIUM),
+                'large': cls.scale_font(cls.FONT_LARGE)
+            }
+        return cls._scaled_cache[key] 
\ No newline at end of file
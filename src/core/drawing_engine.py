@@ -15,6 +15,10 @@ class DrawingEngine:
         self.height = height
         self.bg_color = bg_color
         self.surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            # Match the display pixel format so per-frame blits take SDL's
+            # fast same-format path instead of converting every pixel
+            self.surface = self.surface.convert()
         self.surface.fill(bg_color)
         
         # Drawing state
@@ -115,7 +119,7 @@ class DrawingEngine:
         
         # Restart stroke history and record this as the first state
         self._add_to_history()
-        self.strokes = []
+        self.strokes.clear()
         
     def set_brush_size(self, size_index):
         """Set the brush size by index"""
@@ -2,6 +2,18 @@ import pygame
 import os
 from src.config import Config
 
+# Shared font cache: SysFont construction is far too expensive to repeat
+# on every draw call
+_font_cache = {}
+
+def _get_font(size):
+    """Return a cached default font of the given size"""
+    font = _font_cache.get(size)
+    if font is None:
+        font = pygame.font.SysFont(None, size)
+        _font_cache[size] = font
+    return font
+
 class Button:
     """A clickable button with hover effects"""
     def __init__(self, x, y, width, height, text, callback=None, font_size=None, 
@@ -18,9 +30,13 @@ class Button:
         self.hovered = False
         self.rounded = rounded
         self.border_radius = border_radius
+        self._surface_cache = {}  # Rendered surfaces keyed by visual state
         
-    def draw(self, surface):
-        """Draw the button on the given surface"""
+    def _render_surface(self):
+        """
+        Return the button's rendered surface for its current visual state,
+        re-rendering only when that state has not been seen before.
+        """
         # Determine color based on state
         if self.disabled:
             color = Config.DARK_GRAY
@@ -28,23 +44,46 @@ class Button:
             color = self.hover_color
         else:
             color = self.bg_color
-            
+
+        # Everything the rendering below depends on is part of the key, so
+        # hover/disable flips and text or color changes invalidate naturally
+        text_color = self.text_color if not self.disabled else Config.GRAY
+        key = (self.text, self.font_size, color, text_color, self.disabled, self.rect.size)
+        cached = self._surface_cache.get(key)
+        if cached is not None:
+            return cached
+
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = surf.get_rect()
+
         # Draw button background
         if self.rounded:
             # Draw rounded rectangle
-            pygame.draw.rect(surface, color, self.rect, border_radius=self.border_radius)
-            pygame.draw.rect(surface, Config.BLACK, self.rect, 2, border_radius=self.border_radius)
+            pygame.draw.rect(surf, color, local_rect, border_radius=self.border_radius)
+            pygame.draw.rect(surf, Config.BLACK, local_rect, 2, border_radius=self.border_radius)
         else:
             # Draw regular rectangle
-            pygame.draw.rect(surface, color, self.rect)
-            pygame.draw.rect(surface, Config.BLACK, self.rect, 2)
-        
+            pygame.draw.rect(surf, color, local_rect)
+            pygame.draw.rect(surf, Config.BLACK, local_rect, 2)
+
         # Draw button text
-        font = pygame.font.SysFont(None, self.font_size)
-        text_surf = font.render(self.text, True, self.text_color if not self.disabled else Config.GRAY)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
-        
+        font = _get_font(self.font_size)
+        text_surf = font.render(self.text, True, text_color)
+        text_rect = text_surf.get_rect(center=local_rect.center)
+        surf.blit(text_surf, text_rect)
+
+        self._surface_cache[key] = surf
+        return surf
+
+    def draw(self, surface):
+        """Draw the button on the given surface"""
+        surface.blit(self._render_surface(), self.rect)
+
+    @staticmethod
+    def draw_group(surface, buttons):
+        """Draw several buttons with a single batched Surface.blits call"""
+        surface.blits([(button._render_surface(), button.rect) for button in buttons])
+
     def update(self, mouse_pos):
         """Update the button's hover state"""
         if not self.disabled:
@@ -71,11 +110,18 @@ class Label:
         self.font_size = font_size or Config.FONT_SMALL
         self.color = color
         self.centered = centered
-        
+        self._cache_key = None
+        self._cached_surface = None
+
     def draw(self, surface):
         """Draw the label on the given surface"""
-        font = pygame.font.SysFont(None, self.font_size)
-        text_surf = font.render(self.text, True, self.color)
+        # Re-render the text only when it (or its styling) changes
+        key = (self.text, self.font_size, self.color)
+        if key != self._cache_key:
+            font = _get_font(self.font_size)
+            self._cached_surface = font.render(self.text, True, self.color)
+            self._cache_key = key
+        text_surf = self._cached_surface
         if self.centered:
             text_rect = text_surf.get_rect(center=(self.x, self.y))
         else:
@@ -124,13 +170,19 @@ class Dialog:
             hover_color=(200, 100, 100),
             rounded=True
         )
-        
+
+        # Title and message never change, so render them once up front
+        font = _get_font(Config.FONT_MEDIUM)
+        self._title_surf = font.render(self.title, True, Config.WHITE)
+        self._message_surfs = [font.render(line, True, Config.BLACK)
+                               for line in self.message.split('\n')]
+        self._overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 160))  # Darker semi-transparent black
+
     def draw(self):
         """Draw the dialog box"""
         # Draw semi-transparent overlay
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))  # Darker semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
         
         # Draw dialog background with rounded corners
         pygame.draw.rect(self.screen, Config.WHITE, self.rect, border_radius=15)
@@ -145,17 +197,12 @@ class Dialog:
         )
         pygame.draw.rect(self.screen, Config.BLUE, title_rect, border_top_left_radius=15, border_top_right_radius=15)
         
-        # Draw title text
-        font = pygame.font.SysFont(None, Config.FONT_MEDIUM)
-        title_surf = font.render(self.title, True, Config.WHITE)
-        title_rect = title_surf.get_rect(center=(self.rect.centerx, self.rect.y + 20))
-        self.screen.blit(title_surf, title_rect)
-        
-        # Draw message
-        font = pygame.font.SysFont(None, Config.FONT_MEDIUM)
-        lines = self.message.split('\n')
-        for i, line in enumerate(lines):
-            text_surf = font.render(line, True, Config.BLACK)
+        # Draw title text (pre-rendered in __init__)
+        title_rect = self._title_surf.get_rect(center=(self.rect.centerx, self.rect.y + 20))
+        self.screen.blit(self._title_surf, title_rect)
+
+        # Draw message lines (pre-rendered in __init__)
+        for i, text_surf in enumerate(self._message_surfs):
             text_rect = text_surf.get_rect(center=(self.rect.centerx, self.rect.y + 90 + i * 30))
             self.screen.blit(text_surf, text_rect)
         
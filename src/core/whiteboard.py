@@ -19,6 +19,10 @@ class Whiteboard:
         
         # Set up drawing surface and engine
         self.drawing_engine = DrawingEngine(size[0], size[1])
+
+        # Canvas hit rect, cached so handle_event does not rebuild it on
+        # every mouse event; refreshed whenever pos/size change in resize()
+        self.canvas_rect = pygame.Rect(pos[0], pos[1], size[0], size[1])
         
         # Create UI elements if controls are shown
         self.ui_elements = []
@@ -153,8 +157,8 @@ class Whiteboard:
                     return True
         
         # Handle drawing events
-        canvas_rect = pygame.Rect(self.pos[0], self.pos[1], self.size[0], self.size[1])
-        
+        canvas_rect = self.canvas_rect
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
             if canvas_rect.collidepoint(event.pos):
                 # Convert screen coordinates to canvas coordinates
@@ -191,23 +195,37 @@ class Whiteboard:
         return None  # Whiteboard doesn't return a next screen
         
     def render(self):
-        """Render the whiteboard and its UI"""
+        """
+        Render the whiteboard and its UI.
+
+        Returns:
+            The screen rect touched by the whiteboard, so callers can pass
+            it to pygame.display.update() for a partial display update.
+        """
         # Draw the canvas border
-        pygame.draw.rect(self.screen, Config.BLACK, 
+        pygame.draw.rect(self.screen, Config.BLACK,
                          (self.pos[0]-2, self.pos[1]-2, self.size[0]+4, self.size[1]+4), 2)
-        
+
         # Draw the canvas (drawing surface)
         self.screen.blit(self.drawing_engine.surface, self.pos)
-        
+
+        # Track the area touched for partial display updates
+        dirty_rect = pygame.Rect(self.pos[0] - 2, self.pos[1] - 2,
+                                 self.size[0] + 4, self.size[1] + 4)
+
         # Draw UI elements if controls are shown
         if self.show_controls:
             for element in self.ui_elements:
                 if hasattr(element, 'draw'):
                     element.draw(self.screen)
-                    
+                    if hasattr(element, 'rect'):
+                        dirty_rect.union_ip(element.rect)
+
             # Draw dialog if active
             if self.active_dialog:
                 self.active_dialog.draw()
+
+        return dirty_rect
                 
     def set_color(self, color_index):
         """Set the current brush color"""
@@ -344,6 +362,28 @@ class Whiteboard:
                     return True
         return False
     
+    def resize(self, x, y, width, height):
+        """
+        Reposition and resize the whiteboard in place, preserving the
+        current drawing by scaling it to the new canvas size.
+        """
+        self.pos = (x, y)
+
+        if (width, height) != self.size:
+            self.size = (width, height)
+
+            # Scale the existing canvas content into the new dimensions
+            # instead of discarding it and allocating a fresh surface
+            old_surface = self.drawing_engine.surface
+            self.drawing_engine.width = width
+            self.drawing_engine.height = height
+            self.drawing_engine.surface = pygame.transform.smoothscale(old_surface, (width, height))
+
+        self.canvas_rect = pygame.Rect(x, y, width, height)
+
+        # Rebuild controls for the new geometry
+        self._resize()
+
     def _resize(self):
         """Handle window resize by recreating the UI elements"""
         # Clear existing UI elements
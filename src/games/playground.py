@@ -15,13 +15,26 @@ class WhiteboardPlayground(GameState):
         self.game_manager = game_manager
         self.next_screen_name = None
         self.active_dialog = None
-        
+
+        # Dirty-rect rendering state
+        self._needs_full_redraw = True
+        self._dialog_was_active = False
+
         # Set up UI elements
         self._setup_ui()
+
+        # Per-event-type handlers, looked up by type instead of an if-chain
+        self._event_dispatch = {
+            pygame.VIDEORESIZE: self._on_videoresize,
+            pygame.MOUSEMOTION: self._on_mousemotion,
+        }
         
     def _setup_ui(self):
         """Set up UI elements for the whiteboard playground"""
         screen_width, screen_height = self.screen.get_size()
+
+        # Layout changed, so the static chrome must be repainted
+        self._needs_full_redraw = True
         
         # Get scaled dimensions
         scaled_font_sizes = Config.get_scaled_font_sizes()
@@ -36,13 +49,17 @@ class WhiteboardPlayground(GameState):
         whiteboard_x = Config.scale_width(20)
         whiteboard_y = whiteboard_margin_top
         
-        # Create whiteboard
-        self.whiteboard = Whiteboard(
-            self.screen,
-            (whiteboard_x, whiteboard_y),
-            (whiteboard_width, whiteboard_height),
-            self.game_manager
-        )
+        # Create the whiteboard once; on later calls (window resize) just
+        # reposition and rescale it so the user's drawing is preserved
+        if not hasattr(self, 'whiteboard'):
+            self.whiteboard = Whiteboard(
+                self.screen,
+                (whiteboard_x, whiteboard_y),
+                (whiteboard_width, whiteboard_height),
+                self.game_manager
+            )
+        else:
+            self.whiteboard.resize(whiteboard_x, whiteboard_y, whiteboard_width, whiteboard_height)
         
         # Title
         self.title_label = Label(
@@ -73,34 +90,34 @@ class WhiteboardPlayground(GameState):
             rounded=True,
             font_size=scaled_font_sizes['small']
         )
-        
-        # Find the bottom bar UI panel setup
-        # ... (Assume panel_x, panel_y calculations exist) ...
-        
+
     def handle_event(self, event):
         """Handle pygame events"""
         # Handle dialog events first if active
         if self.active_dialog:
             if self.active_dialog.handle_event(event):
                 return True
-        
-        # Handle resize event
-        if event.type == pygame.VIDEORESIZE:
-            # Recreate UI elements when window is resized
-            self._setup_ui()
+
+        # Type-specific handling via a dict lookup instead of an if-chain
+        handler = self._event_dispatch.get(event.type)
+        if handler and handler(event):
             return True
-        
+
         # Pass events to whiteboard
         if self.whiteboard.handle_event(event):
             return True
-            
+
         # Handle button events
-        if event.type == pygame.MOUSEMOTION:
-            self.menu_button.update(event.pos)
-            
-        if self.menu_button.handle_event(event):
-            return True
-        
+        return self.menu_button.handle_event(event)
+
+    def _on_videoresize(self, event):
+        """Recreate UI elements when the window is resized"""
+        self._setup_ui()
+        return True
+
+    def _on_mousemotion(self, event):
+        """Track hover state from the motion event itself"""
+        self.menu_button.update(event.pos)
         return False
         
     def update(self, dt):
@@ -124,27 +141,47 @@ class WhiteboardPlayground(GameState):
         return None
         
     def draw(self):
-        """Render the game"""
-        self.screen.fill(Config.LIGHT_GRAY)
-        
-        # Draw header bar
-        pygame.draw.rect(self.screen, Config.BLUE, self.header_rect)
-        
-        # Draw title
-        title_color_original = self.title_label.color
-        self.title_label.color = Config.WHITE
-        self.title_label.draw(self.screen)
-        self.title_label.color = title_color_original
-        
-        # Draw whiteboard using its render method
-        self.whiteboard.render()
-        
-        # Draw buttons
+        """
+        Render the game.
+
+        Returns a list of dirty rects when only the dynamic regions changed,
+        or None to request a full display flip.
+        """
+        dialog_active = (self.active_dialog is not None
+                         or self.whiteboard.active_dialog is not None)
+        full_redraw = self._needs_full_redraw or dialog_active or self._dialog_was_active
+        self._dialog_was_active = dialog_active
+
+        if full_redraw:
+            self._needs_full_redraw = False
+            self.screen.fill(Config.LIGHT_GRAY)
+
+            # Draw header bar
+            pygame.draw.rect(self.screen, Config.BLUE, self.header_rect)
+
+            # Draw title
+            title_color_original = self.title_label.color
+            self.title_label.color = Config.WHITE
+            self.title_label.draw(self.screen)
+            self.title_label.color = title_color_original
+
+            # Draw whiteboard using its render method
+            self.whiteboard.render()
+
+            # Draw buttons
+            self.menu_button.draw(self.screen)
+
+            # Draw dialog if active
+            if self.active_dialog:
+                self.active_dialog.draw()
+
+            return None
+
+        # Static chrome is unchanged - repaint just the whiteboard and buttons
+        dirty_rects = [self.whiteboard.render()]
         self.menu_button.draw(self.screen)
-        
-        # Draw dialog if active
-        if self.active_dialog:
-            self.active_dialog.draw()
+        dirty_rects.append(self.menu_button.rect)
+        return dirty_rects
         
     def _back_to_menu_with_check(self):
         """Check if whiteboard has content before going back to menu"""
@@ -174,15 +211,6 @@ class WhiteboardPlayground(GameState):
         self.next_screen_name = 'main_menu'
 
     def handle_resize(self):
-        screen_width, screen_height = self.screen.get_size()
-        self.whiteboard.resize(0, Config.scale_height(80), screen_width, screen_height - Config.scale_height(80))
-        self._setup_ui()
-        
-    # Remove the old clear drawing method if it exists
-    # def _clear_drawing(self): ...
-    # Remove the old confirmation method if it exists
-    # def _show_clear_confirmation(self): ...
-
-    # Remove this method as it's handled by returning state name from update
-    # def _go_to_menu(self):
-    #     self.game_manager.change_state('main_menu') 
\ No newline at end of file
+        # _setup_ui repositions and rescales the existing whiteboard, so the
+        # canvas surface is only touched once per resize event
+        self._setup_ui()
\ No newline at end of file
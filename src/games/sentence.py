@@ -1,4 +1,6 @@
 import pygame
+import random
+import numpy as np
 from typing import List, Tuple, Optional, Dict
 from src.config import Config
 from src.core.ui_manager import Button, Label, Dialog
@@ -19,20 +21,33 @@ class TraceTheSentence(GameState):
         self.game_manager = game_manager
         self.next_screen_name = None
         self.active_dialog = None
-        self.request_menu_exit = False
-        
+
         # Get screen dimensions
         self.screen_width, self.screen_height = self.screen.get_size()
         
         # Initialize game state
         self.current_sentence_index = 0
-        self.drawn_points = []
+        # Stroke storage: a growing float32 array (structure-of-arrays
+        # style) so NumPy evaluation never has to re-box Python tuples
+        self._drawn_buffer = np.empty((256, 2), dtype=np.float32)
+        self.drawn_count = 0
         self.current_text_paths = []
         self.is_tracing = False
         self.sentence_completed = False
         self.point_count = 0
         self.last_evaluation_time = 0
+        self.last_evaluated_count = 0
+        self.last_evaluation_pos = None
         self.auto_progress_timer = None
+
+        # Dirty-rect rendering state
+        self._needs_full_redraw = True
+        self._dialog_was_active = False
+
+        # Per-sentence assets (letter paths, target arrays, rendered outline)
+        # keyed by (text, size, canvas size), so revisiting a sentence skips
+        # path generation and guide rasterization entirely
+        self._outline_cache = {}
         
         # Initialize difficulty settings
         self.difficulty_settings = {
@@ -71,26 +86,40 @@ class TraceTheSentence(GameState):
         
         # Initialize accuracy tracker
         self.accuracy_tracker = AccuracyTracker()
-        
+
+        # Warm the per-sentence caches up front so navigating between
+        # sentences never pays the path-generation/rasterization latency
+        for sentence_data in self.sentences_data:
+            self._build_sentence_assets(sentence_data)
+
         # Generate first sentence
         self._generate_current_sentence()
         
     def _setup_ui(self):
         """Set up UI elements for the game"""
-        # Get scaled dimensions
+        # Layout changed, so the static chrome must be repainted
+        self._needs_full_redraw = True
+
+        # Get scaled dimensions, computing each scaled value only once
+        # instead of re-deriving it on every use below
+        scale_w = Config.scale_width
+        scale_h = Config.scale_height
         scaled_font_sizes = Config.get_scaled_font_sizes()
         scaled_button_width, scaled_button_height = Config.get_scaled_button_dimensions()
-        
-        # Header bar height
-        header_height = Config.scale_height(60)
+        margin = scale_w(20)
+
+        # Header bar height; kept on self so draw() reuses the scaled value
+        # instead of re-deriving it every full repaint
+        header_height = scale_h(60)
+        self.header_height = header_height
         
         # Create whiteboard with specific dimensions
-        whiteboard_width = self.screen_width - Config.scale_width(260)  # Leave more space for accuracy panel
-        whiteboard_height = self.screen_height - header_height - Config.scale_height(180)  # Space for header and controls
+        whiteboard_width = self.screen_width - scale_w(260)  # Leave more space for accuracy panel
+        whiteboard_height = self.screen_height - header_height - scale_h(180)  # Space for header and controls
         
         self.whiteboard = Whiteboard(
             self.screen,
-            (Config.scale_width(20), header_height + Config.scale_height(60)),  # Position below header
+            (margin, header_height + scale_h(60)),  # Position below header
             (whiteboard_width, whiteboard_height),
             show_controls=False
         )
@@ -98,7 +127,7 @@ class TraceTheSentence(GameState):
         # Create sentence label
         self.sentence_label = Label(
             self.screen_width // 2,
-            Config.scale_height(30),
+            scale_h(30),
             "Sentence",
             font_size=scaled_font_sizes['medium'],
             centered=True
@@ -107,7 +136,7 @@ class TraceTheSentence(GameState):
         # Create instruction label
         self.instruction_label = Label(
             self.screen_width // 2,
-            self.screen_height - Config.scale_height(40),
+            self.screen_height - scale_h(40),
             "Trace the sentence to improve your handwriting",
             font_size=scaled_font_sizes['small'],
             centered=True
@@ -115,21 +144,21 @@ class TraceTheSentence(GameState):
         
         # Create accuracy panel with more width
         self.accuracy_panel_rect = pygame.Rect(
-            self.screen_width - Config.scale_width(240),
-            header_height + Config.scale_height(80),
-            Config.scale_width(220),
-            Config.scale_height(200)
+            self.screen_width - scale_w(240),
+            header_height + scale_h(80),
+            scale_w(220),
+            scale_h(200)
         )
         
         # Button spacing and dimensions
-        button_margin = Config.scale_width(20)
+        button_margin = margin
         button_width = scaled_button_width * 0.85  # Slightly smaller buttons
         button_spacing = (whiteboard_width - 4 * button_width - 2 * button_margin) / 3
-        button_y = self.screen_height - Config.scale_height(100)  # Move buttons up
+        button_y = self.screen_height - scale_h(100)  # Move buttons up
         
         # Create buttons with proper spacing
         self.menu_button = Button(
-            Config.scale_width(20),
+            margin,
             button_y,
             button_width,
             scaled_button_height,
@@ -143,7 +172,7 @@ class TraceTheSentence(GameState):
         )
         
         self.clear_button = Button(
-            Config.scale_width(20) + button_width + button_spacing,
+            margin + button_width + button_spacing,
             button_y,
             button_width,
             scaled_button_height,
@@ -157,7 +186,7 @@ class TraceTheSentence(GameState):
         )
         
         self.next_sentence_button = Button(
-            Config.scale_width(20) + (button_width + button_spacing) * 2,
+            margin + (button_width + button_spacing) * 2,
             button_y,
             button_width,
             scaled_button_height,
@@ -172,7 +201,7 @@ class TraceTheSentence(GameState):
         )
         
         self.random_sentence_button = Button(
-            Config.scale_width(20) + (button_width + button_spacing) * 3,
+            margin + (button_width + button_spacing) * 3,
             button_y,
             button_width,
             scaled_button_height,
@@ -186,21 +215,23 @@ class TraceTheSentence(GameState):
         )
         
         # Create difficulty buttons with better spacing
-        difficulty_button_width = Config.scale_width(80)
-        difficulty_button_height = Config.scale_height(30)
-        difficulty_start_x = Config.scale_width(20)
-        difficulty_y = header_height + Config.scale_height(20)
+        difficulty_button_width = scale_w(80)
+        difficulty_button_height = scale_h(30)
+        difficulty_start_x = margin
+        difficulty_y = header_height + scale_h(20)
         
         self.difficulty_buttons = {}
-        diff_colors = {
+        # Kept on self so _set_difficulty can restyle buttons by direct
+        # dict lookup instead of scanning for a matching label
+        self._diff_colors = diff_colors = {
             "Easy": (100, 200, 100),    # Light green
             "Medium": (200, 150, 50),    # Orange
             "Hard": (200, 100, 100)      # Red
         }
-        
+
         for i, difficulty in enumerate(self.difficulty_settings.keys()):
             self.difficulty_buttons[difficulty] = Button(
-                difficulty_start_x + (difficulty_button_width + Config.scale_width(10)) * i,
+                difficulty_start_x + (difficulty_button_width + scale_w(10)) * i,
                 difficulty_y,
                 difficulty_button_width,
                 difficulty_button_height,
@@ -212,89 +243,121 @@ class TraceTheSentence(GameState):
                 rounded=True,
                 font_size=scaled_font_sizes['small']
             )
-            
+
+        # Single flat tuple so hover updates touch every button in one loop
+        self._hover_buttons = (
+            self.menu_button,
+            self.clear_button,
+            self.next_sentence_button,
+            self.random_sentence_button,
+        ) + tuple(self.difficulty_buttons.values())
+
+        # Cache the canvas origin so per-event coordinate conversion skips
+        # the tuple indexing on self.whiteboard.pos
+        self._wb_x, self._wb_y = self.whiteboard.pos
+
+    def _build_sentence_assets(self, sentence_data):
+        """
+        Return (paths, target_points, target_geometry, outline) for a
+        sentence on the current canvas, computing and caching them on first
+        use. The outline is an overlay surface blitted over the canvas each
+        frame instead of being baked into the drawing surface (so Clear
+        never has to repaint it), converted to the display pixel format so
+        the per-frame blit takes the fast SDL path.
+        """
+        wb_width, wb_height = self.whiteboard.size
+
+        # Calculate an appropriate size for the text (based on whiteboard),
+        # kept an int so downstream coordinates stay on the integer fast path
+        base_size = min(wb_width, wb_height) // 8
+        size = int(base_size / sentence_data["difficulty"])
+
+        cache_key = (sentence_data["text"], size, (wb_width, wb_height))
+        assets = self._outline_cache.get(cache_key)
+        if assets is None:
+            paths = TextPathGenerator.generate_text_path(
+                sentence_data["text"],
+                (wb_width // 6, wb_height // 3),  # Start position
+                size
+            )
+
+            # Flatten the per-letter paths once into one contiguous array and
+            # precompute its segment geometry for the repeated accuracy queries
+            flat_points = [point for path in paths for point in path]
+            target_points = np.asarray(flat_points, dtype=np.float32)
+            target_geometry = PathDetection.precompute_target_geometry(target_points)
+
+            outline = pygame.Surface((wb_width, wb_height), pygame.SRCALPHA)
+            TextPathGenerator.draw_text_outline(
+                outline,
+                paths,
+                Config.BLUE,
+                width=4,
+                alpha=100
+            )
+            outline = outline.convert_alpha()
+
+            assets = (paths, target_points, target_geometry, outline)
+            self._outline_cache[cache_key] = assets
+        return assets
+
     def _generate_current_sentence(self):
         """Generate the current sentence based on the index"""
         if self.current_sentence_index >= len(self.sentences_data):
             # Loop back to first sentence if we've gone through all sentences
             self.current_sentence_index = 0
-        
+
         # Get current sentence data
         sentence_data = self.sentences_data[self.current_sentence_index]
-        
-        # Get whiteboard dimensions
-        wb_width, wb_height = self.whiteboard.size
-        
-        # Create a completely new white surface
-        self.whiteboard.drawing_engine.surface = pygame.Surface((wb_width, wb_height))
+
+        # Wipe the existing surface in place rather than allocating a new one
         self.whiteboard.drawing_engine.surface.fill(Config.WHITE)
-        
-        # Calculate an appropriate size for the text (based on whiteboard)
-        base_size = min(wb_width, wb_height) // 8
-        
-        # Adjust size based on difficulty
-        size = base_size // sentence_data["difficulty"]
-        
-        # Generate text paths
-        self.current_text_paths = TextPathGenerator.generate_text_path(
-            sentence_data["text"],
-            (wb_width // 6, wb_height // 3),  # Start position
-            size
-        )
-        
-        # Update sentence label
+
+        # Fetch the (usually pre-warmed) paths, target arrays and outline
+        (self.current_text_paths,
+         self.target_points,
+         self.target_geometry,
+         self.outline_surface) = self._build_sentence_assets(sentence_data)
+
+        # Update sentence label (lives on the header, so repaint everything)
         self.sentence_label.text = sentence_data["name"]
-        
+        self._needs_full_redraw = True
+
         # Reset tracing state
-        self.drawn_points = []
+        self._reset_drawn_points()
+        self.last_evaluated_count = 0
+        self.last_evaluation_pos = None
         self.accuracy_tracker.reset()
         self.accuracy_tracker.set_current_shape(sentence_data["name"])
         self.is_tracing = False
         self.sentence_completed = False
         self.next_sentence_button.disabled = True
         self.auto_progress_timer = None
-        
-        # Draw the text outline
-        TextPathGenerator.draw_text_outline(
-            self.whiteboard.drawing_engine.surface,
-            self.current_text_paths,
-            Config.BLUE,
-            width=4,
-            alpha=100
-        )
-        
+
         # Add to drawing history
         self.whiteboard.drawing_engine._add_to_history()
         
     def _clear_drawing(self):
         """Clear the current drawing but keep the text outline"""
-        # Get the current whiteboard size
-        wb_width, wb_height = self.whiteboard.size
-        
-        # Create a completely new white surface
-        self.whiteboard.drawing_engine.surface = pygame.Surface((wb_width, wb_height))
+        # Wipe the existing surface in place rather than allocating a new one
         self.whiteboard.drawing_engine.surface.fill(Config.WHITE)
-        
+
         # Reset drawn points and tracing state
-        self.drawn_points = []
+        self._reset_drawn_points()
+        self.last_evaluated_count = 0
+        self.last_evaluation_pos = None
         self.is_tracing = False
-        
+
         # Reset and update the accuracy tracker
         self.accuracy_tracker.reset()
         self.accuracy_tracker.set_current_shape(self.sentences_data[self.current_sentence_index]["name"])
         
         # Update button state
         self.next_sentence_button.disabled = not self.sentence_completed
-        
-        # Redraw the text outline
-        TextPathGenerator.draw_text_outline(
-            self.whiteboard.drawing_engine.surface,
-            self.current_text_paths,
-            Config.BLUE,
-            width=4,
-            alpha=100
-        )
-        
+
+        # The text outline lives on its own overlay surface, so clearing the
+        # drawing surface does not require re-rendering it
+
         # Add this clear action to the drawing history
         self.whiteboard.drawing_engine._add_to_history()
         
@@ -307,41 +370,59 @@ class TraceTheSentence(GameState):
             
     def _random_sentence(self):
         """Switch to a random sentence"""
-        import random
-        
-        # Get a random sentence index different from current
-        if len(self.sentences_data) > 1:
-            new_index = self.current_sentence_index
-            while new_index == self.current_sentence_index:
-                new_index = random.randint(0, len(self.sentences_data) - 1)
-            self.current_sentence_index = new_index
-        else:
-            # If only one sentence, just restart it
-            pass
-            
+        # Pick a random offset in [1, n-1] so the new index is always
+        # different from the current one, with no retry loop
+        count = len(self.sentences_data)
+        if count > 1:
+            offset = random.randint(1, count - 1)
+            self.current_sentence_index = (self.current_sentence_index + offset) % count
+
         # Generate the new sentence with a clear whiteboard
         self._generate_current_sentence()
         
     def _set_difficulty(self, difficulty: str):
         """Set the current difficulty level"""
         if difficulty in self.difficulty_settings:
-            # Update button colors
-            for button in self.difficulty_buttons.values():
-                if button.text == difficulty:
-                    button.bg_color = Config.GREEN
-                else:
-                    button.bg_color = Config.LIGHT_GRAY
-            
+            # Update button colors by name, matching the styling _setup_ui
+            # gives the initially-selected difficulty
+            for name, button in self.difficulty_buttons.items():
+                selected = name == difficulty
+                button.bg_color = self._diff_colors[name] if selected else Config.LIGHT_GRAY
+                button.text_color = Config.WHITE if selected else Config.BLACK
+
             # Update current difficulty
             self.current_difficulty = difficulty
             
             # Reset the current sentence
             self._clear_drawing()
             
+    @property
+    def drawn_points(self):
+        """View of the recorded stroke as an (N, 2) float32 array"""
+        return self._drawn_buffer[:self.drawn_count]
+
+    def _reset_drawn_points(self):
+        """Empty the stroke buffer without releasing its capacity"""
+        self.drawn_count = 0
+        # Running totals for incremental evaluation: live updates only
+        # score points added since the previous pass and fold them in here
+        self._eval_index = 0
+        self._eval_on_path = 0
+        self._eval_distance_sum = 0.0
+        self._eval_max_distance = 0.0
+
+    def _append_drawn_point(self, pos):
+        """Append one canvas point, growing the buffer geometrically"""
+        if self.drawn_count == len(self._drawn_buffer):
+            self._drawn_buffer = np.resize(self._drawn_buffer, (len(self._drawn_buffer) * 2, 2))
+        self._drawn_buffer[self.drawn_count] = pos
+        self.drawn_count += 1
+
     def _request_menu_exit(self):
-        """Sets the flag to request returning to the main menu."""
-        # Add confirmation dialog logic if needed
-        self.request_menu_exit = True
+        """Return to the main menu immediately."""
+        # Switch states directly (as the text converter does) instead of
+        # setting a flag that update() only notices one frame later
+        self.game_manager.change_state('main_menu')
         
     def _evaluate_tracing(self, is_final=False):
         """
@@ -353,21 +434,36 @@ class TraceTheSentence(GameState):
         if len(self.drawn_points) < 5:
             # Not enough data to evaluate
             return
-        
+
+        # While the completion dialog is up the results cannot be acted on
+        if self.active_dialog is not None:
+            return
+
+        # Memoize on the drawn-point count: if nothing was added since the
+        # last evaluation, the metrics cannot have changed
+        if len(self.drawn_points) == self.last_evaluated_count and not is_final:
+            return
+        self.last_evaluated_count = len(self.drawn_points)
+
         # Calculate accuracy with difficulty-based tolerance
         tolerance = self.difficulty_settings[self.current_difficulty]
-        
-        # Flatten all text paths into one list for evaluation
-        all_points = []
-        for path in self.current_text_paths:
-            all_points.extend(path)
-        
-        metrics = PathDetection.calculate_tracing_accuracy(
-            self.drawn_points,
-            all_points,
-            tolerance=tolerance  # Use difficulty-based tolerance
-        )
-        
+
+        if is_final:
+            # The final pass re-scores the whole stroke exactly, decimating
+            # near-collinear event samples so the evaluation scores the
+            # stroke's geometry, not the event rate
+            drawn_points = self.drawn_points
+            if len(drawn_points) > 50:
+                drawn_points = PathDetection.simplify_path(drawn_points, epsilon=2.0)
+            metrics = PathDetection.calculate_tracing_accuracy(
+                drawn_points,
+                self.target_points,  # Flattened once at generation time
+                tolerance=tolerance,  # Use difficulty-based tolerance
+                geometry=self.target_geometry
+            )
+        else:
+            metrics = self._incremental_metrics(tolerance)
+
         # Update accuracy tracker
         self.accuracy_tracker.update_metrics(metrics)
         
@@ -382,7 +478,7 @@ class TraceTheSentence(GameState):
                 def close_dialog():
                     self.active_dialog = None
                     # Set timer for auto-progression (3 seconds)
-                    self.auto_progress_timer = pygame.time.get_ticks() + 3000
+                    self.auto_progress_timer = self.game_manager.now_ms + 3000
                     
                 self.active_dialog = Dialog(
                     self.screen,
@@ -395,6 +491,30 @@ class TraceTheSentence(GameState):
                     confirm_text="OK"
                 )
         
+    def _incremental_metrics(self, tolerance):
+        """
+        Score only the points added since the last evaluation and fold them
+        into running totals, so live feedback stays O(new points) instead of
+        re-scoring the entire stroke on every pass.
+        """
+        new_points = self.drawn_points[self._eval_index:]
+        if len(new_points) > 0:
+            distances = PathDetection.distances_to_path(
+                new_points, self.target_points, self.target_geometry)
+            self._eval_on_path += int((distances <= tolerance).sum())
+            self._eval_distance_sum += float(distances.sum())
+            self._eval_max_distance = max(self._eval_max_distance, float(distances.max()))
+            self._eval_index = self.drawn_count
+
+        total = self._eval_index
+        return {
+            "percentage": (self._eval_on_path / total) * 100 if total else 0.0,
+            "on_path_points": self._eval_on_path,
+            "total_points": total,
+            "avg_distance": self._eval_distance_sum / total if total else float('inf'),
+            "max_distance": self._eval_max_distance
+        }
+
     def handle_event(self, event):
         """Handle pygame events"""
         # Handle dialogs first
@@ -406,7 +526,12 @@ class TraceTheSentence(GameState):
         if event.type == pygame.VIDEORESIZE:
             self.handle_resize()
             return True
-            
+
+        # Hover state is driven by motion events instead of polling the
+        # mouse position every frame
+        if event.type == pygame.MOUSEMOTION:
+            self._update_hover(event.pos)
+
         # Handle Buttons
         button_handled = False
         if self.menu_button.handle_event(event): button_handled = True
@@ -417,81 +542,139 @@ class TraceTheSentence(GameState):
 
         # Handle whiteboard
         if self.whiteboard.handle_event(event):
-            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            # Record the stroke (in canvas coordinates) so tracing accuracy
+            # can be evaluated; strokes accumulate across the whole sentence
+            if self.whiteboard.drawing_engine.is_drawing and event.type in (
+                    pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION):
+                canvas_pos = (
+                    event.pos[0] - self._wb_x,
+                    event.pos[1] - self._wb_y
+                )
+                self._append_drawn_point(canvas_pos)
+                self.is_tracing = True
+                # Once the sentence is completed the metrics cannot change
+                # anything further, so stop re-scoring mid-stroke (the user
+                # can still keep drawing)
+                if event.type == pygame.MOUSEMOTION and not self.sentence_completed:
+                    # Evaluate at a fixed cadence (every 10 samples or
+                    # 100 ms), and only once the cursor has actually moved
+                    # a few pixels from where it was last scored
+                    self.point_count += 1
+                    # One tick read per event batch (set by the main loop)
+                    # instead of a get_ticks() call per motion event
+                    current_time = self.game_manager.now_ms
+                    last_pos = self.last_evaluation_pos
+                    moved_enough = (
+                        last_pos is None
+                        or abs(canvas_pos[0] - last_pos[0])
+                        + abs(canvas_pos[1] - last_pos[1]) >= 4
+                    )
+                    if moved_enough and (self.point_count >= 10
+                            or current_time - self.last_evaluation_time > 100):
+                        self._evaluate_tracing(is_final=False)
+                        self.point_count = 0
+                        self.last_evaluation_time = current_time
+                        self.last_evaluation_pos = canvas_pos
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 if not self.whiteboard.drawing_engine.is_drawing:
+                    self.is_tracing = False
                     self._evaluate_tracing(is_final=True)
             return True
-            
+
         return False
         
+    def _update_hover(self, mouse_pos):
+        """Refresh hover state for all interactive elements in one pass"""
+        for button in self._hover_buttons:
+            button.update(mouse_pos)
+        if self.active_dialog:
+            self.active_dialog.update(mouse_pos)
+
     def update(self, dt):
         """Update game state"""
-        mouse_pos = pygame.mouse.get_pos()
         self.whiteboard.update(dt)
-        # Update buttons
-        self.menu_button.update(mouse_pos)
-        self.clear_button.update(mouse_pos)
-        self.next_sentence_button.update(mouse_pos)
-        self.random_sentence_button.update(mouse_pos)
-        
-        # Update dialog if active
-        if self.active_dialog and mouse_pos:
-            self.active_dialog.update(mouse_pos)
-            
+
         # Check for auto-progression timer
-        if self.auto_progress_timer and pygame.time.get_ticks() > self.auto_progress_timer:
+        if self.auto_progress_timer and self.game_manager.now_ms > self.auto_progress_timer:
             self.auto_progress_timer = None
             self._next_sentence()  # Automatically progress to next sentence
-            
-        # Check for state transition request
-        if self.request_menu_exit:
-            self.request_menu_exit = False
-            return 'main_menu'
+
         return None
         
     def draw(self):
-        """Render the game screen"""
-        # Clear screen
-        self.screen.fill(Config.WHITE)
-        
-        # Draw header bar
-        pygame.draw.rect(self.screen, Config.BLUE, (0, 0, self.screen_width, Config.scale_height(60)))
-        
-        # Draw sentence label with white color for contrast
-        title_color_original = self.sentence_label.color
-        self.sentence_label.color = Config.WHITE
-        self.sentence_label.draw(self.screen)
-        self.sentence_label.color = title_color_original
-        
-        # Draw whiteboard
-        self.whiteboard.render()
-        
+        """
+        Render the game screen.
+
+        Returns a list of dirty rects when only the dynamic regions changed,
+        or None to request a full display flip.
+        """
+        dialog_active = self.active_dialog is not None
+        full_redraw = self._needs_full_redraw or dialog_active or self._dialog_was_active
+        self._dialog_was_active = dialog_active
+
+        if full_redraw:
+            self._needs_full_redraw = False
+
+            # Clear screen
+            self.screen.fill(Config.WHITE)
+
+            # Draw header bar
+            pygame.draw.rect(self.screen, Config.BLUE, (0, 0, self.screen_width, self.header_height))
+
+            # Draw sentence label with white color for contrast
+            title_color_original = self.sentence_label.color
+            self.sentence_label.color = Config.WHITE
+            self.sentence_label.draw(self.screen)
+            self.sentence_label.color = title_color_original
+
+            # Draw instruction label
+            self.instruction_label.draw(self.screen)
+
+        # Draw whiteboard, then the cached text outline on top of the canvas
+        dirty_rects = [self.whiteboard.render()]
+        self.screen.blit(self.outline_surface, self.whiteboard.pos)
+
         # Draw accuracy panel
         self.accuracy_tracker.draw_accuracy_panel(
             self.screen,
             (self.accuracy_panel_rect.x, self.accuracy_panel_rect.y),
             (self.accuracy_panel_rect.width, self.accuracy_panel_rect.height)
         )
-        
-        # Draw buttons
-        self.menu_button.draw(self.screen)
-        self.clear_button.draw(self.screen)
-        self.next_sentence_button.draw(self.screen)
-        self.random_sentence_button.draw(self.screen)
-        
-        # Draw difficulty buttons
-        for button in self.difficulty_buttons.values():
-            button.draw(self.screen)
-            
-        # Draw instruction label
-        self.instruction_label.draw(self.screen)
-        
+        dirty_rects.append(self.accuracy_panel_rect)
+
+        # Draw control buttons in one batched blit
+        control_buttons = (
+            self.menu_button,
+            self.clear_button,
+            self.next_sentence_button,
+            self.random_sentence_button
+        )
+        Button.draw_group(self.screen, control_buttons)
+        dirty_rects.extend(button.rect for button in control_buttons)
+
+        # Draw difficulty buttons in one batched blit
+        difficulty_buttons = tuple(self.difficulty_buttons.values())
+        Button.draw_group(self.screen, difficulty_buttons)
+        dirty_rects.extend(button.rect for button in difficulty_buttons)
+
         # Draw dialog if active
         if self.active_dialog:
             self.active_dialog.draw()
+
+        # A full repaint needs a full flip; otherwise only the dynamic
+        # regions were touched
+        return None if full_redraw else dirty_rects
         
     def handle_resize(self):
+        # Skip the expensive UI and path rebuild when the window dimensions
+        # did not actually change (SDL can emit redundant resize events)
+        new_size = self.screen.get_size()
+        if new_size == (self.screen_width, self.screen_height):
+            return
+        self.screen_width, self.screen_height = new_size
         self._setup_ui()
+        # Outlines rendered for the old canvas size can never be reused
+        self._outline_cache.clear()
         self._generate_current_sentence()
         
     # Remove the redundant render method added previously
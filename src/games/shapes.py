@@ -2,11 +2,16 @@ import pygame
 import math
 import random
 import time
+import numpy as np
 from typing import List, Tuple, Dict, Any, Optional
 from src.config import Config
 from src.core.whiteboard import Whiteboard
 from src.core.ui_manager import Button, Label, Dialog
 from src.utils.path_detection import PathDetection
+
+# Custom event fired by the one-shot auto-progress timer
+# (USEREVENT + 1 is taken by the text converter's OCR_COMPLETE)
+AUTO_PROGRESS = pygame.USEREVENT + 2
 from src.utils.accuracy import AccuracyTracker
 from src.core.game_state import GameState
 
@@ -14,6 +19,17 @@ class DrawBasicShapes(GameState):
     """
     Draw Basic Shapes - A game where users trace over shapes to improve cursor control.
     """
+
+    # Difficulty button styling, computed once at class definition: the
+    # full color marks the selected difficulty, the lightened variant the
+    # unselected ones
+    _DIFF_COLORS = {
+        "Easy": Config.GREEN,
+        "Medium": (255, 165, 0),  # Orange
+        "Hard": Config.RED
+    }
+    _DIFF_MUTED = {k: tuple(min(255, c + 70) for c in v) for k, v in _DIFF_COLORS.items()}
+
     def __init__(self, screen, game_manager):
         super().__init__(screen, game_manager)
         self.screen = screen
@@ -44,12 +60,38 @@ class DrawBasicShapes(GameState):
         
         self.current_shape_index = 0
         self.current_shape_points = []
-        self.drawn_points = []
+        # Stroke storage: a growing float32 array so NumPy evaluation never
+        # has to re-box Python tuples (mirrors the sentence game)
+        self._drawn_buffer = np.empty((256, 2), dtype=np.float32)
+        self.drawn_count = 0
         self.accuracy_tracker = AccuracyTracker()
         self.is_tracing = False
         self.shape_completed = False
-        self.auto_progress_timer = None  # Timer for automatic progression
-        
+
+        # Real-time evaluation throttle state (instance state, not class
+        # attributes, so multiple screens never share counters)
+        self.point_count = 0
+        self.last_evaluation_time = 0
+        self.last_evaluation_pos = None  # Canvas pos of the last scored point
+
+        # Timestamp of the last hover refresh; motion events arrive at
+        # mouse-poll rate, so hover work is time-sliced to ~60 Hz
+        self._last_hover_ms = 0
+
+        # Resize events are coalesced: the flag defers the (expensive) UI
+        # and shape rebuild to the next update() pass
+        self._pending_resize = False
+
+        # Rendered shape outlines keyed by (type, size, canvas size), so
+        # Clear and shape revisits blit a cached surface instead of
+        # re-rasterizing the alpha-blended outline
+        self._outline_cache = {}
+
+        # Lazy rendering: the static chrome is repainted only when flagged
+        # dirty; steady-state frames touch just the dynamic regions
+        self._needs_full_redraw = True
+        self._dialog_was_active = False
+
         # Set up UI elements - THIS MUST CREATE self.whiteboard
         self._setup_ui()
         
@@ -58,19 +100,23 @@ class DrawBasicShapes(GameState):
         
     def _setup_ui(self):
         """Set up UI elements for the shape tracing game"""
+        self._needs_full_redraw = True
         screen_width, screen_height = self.screen.get_size()
         
-        # Get scaled dimensions
+        # Get scaled dimensions, binding the scalers once instead of
+        # re-resolving Config attributes for every value below
+        scale_w = Config.scale_width
+        scale_h = Config.scale_height
         scaled_font_sizes = Config.get_scaled_font_sizes()
         scaled_button_width, scaled_button_height = Config.get_scaled_button_dimensions()
         
         # Calculate whiteboard position and size - leave more space for accuracy panel
-        accuracy_panel_width = Config.scale_width(220)  # Increase width for panel
-        whiteboard_margin_top = Config.scale_height(80)  # Increased for better header spacing
-        whiteboard_margin_bottom = Config.scale_height(80)  # Increased for button spacing
-        whiteboard_width = screen_width - Config.scale_width(40) - accuracy_panel_width
+        accuracy_panel_width = scale_w(220)  # Increase width for panel
+        whiteboard_margin_top = scale_h(80)  # Increased for better header spacing
+        whiteboard_margin_bottom = scale_h(80)  # Increased for button spacing
+        whiteboard_width = screen_width - scale_w(40) - accuracy_panel_width
         whiteboard_height = screen_height - whiteboard_margin_top - whiteboard_margin_bottom
-        whiteboard_x = Config.scale_width(20)
+        whiteboard_x = scale_w(20)
         whiteboard_y = whiteboard_margin_top
         
         # Create whiteboard with correct arguments
@@ -84,19 +130,19 @@ class DrawBasicShapes(GameState):
         # Title
         self.title_label = Label(
             screen_width // 2,
-            Config.scale_height(25),
+            scale_h(25),
             "Draw Basic Shapes",
             font_size=scaled_font_sizes['large'],
             centered=True
         )
         
         # Header bar
-        self.header_rect = pygame.Rect(0, 0, screen_width, Config.scale_height(60))
+        self.header_rect = pygame.Rect(0, 0, screen_width, scale_h(60))
         
         # Shape name label - position above the whiteboard
         self.shape_label = Label(
             whiteboard_x + whiteboard_width // 2,
-            whiteboard_y - Config.scale_height(25),
+            whiteboard_y - scale_h(25),
             "Circle",  # Will be updated in _generate_current_shape
             font_size=scaled_font_sizes['medium'],
             centered=True
@@ -105,17 +151,17 @@ class DrawBasicShapes(GameState):
         # Instruction label - position below the whiteboard with proper spacing
         self.instruction_label = Label(
             whiteboard_x + whiteboard_width // 2,
-            whiteboard_y + whiteboard_height + Config.scale_height(10),
+            whiteboard_y + whiteboard_height + scale_h(10),
             "Trace the shape as accurately as you can",
             font_size=scaled_font_sizes['small'],
             centered=True
         )
         
         # Set up difficulty selector in the top-right corner
-        difficulty_panel_width = Config.scale_width(300)
-        difficulty_panel_height = Config.scale_height(40)
-        difficulty_panel_x = screen_width - difficulty_panel_width - Config.scale_width(20)
-        difficulty_panel_y = Config.scale_height(10)
+        difficulty_panel_width = scale_w(300)
+        difficulty_panel_height = scale_h(40)
+        difficulty_panel_x = screen_width - difficulty_panel_width - scale_w(20)
+        difficulty_panel_y = scale_h(10)
         
         self.difficulty_label = Label(
             difficulty_panel_x,
@@ -126,27 +172,17 @@ class DrawBasicShapes(GameState):
         )
         
         # Create difficulty buttons
-        diff_button_width = Config.scale_width(70)
-        diff_button_height = Config.scale_height(30)
-        diff_button_y = difficulty_panel_y + Config.scale_height(5)
-        
-        diff_colors = {
-            "Easy": Config.GREEN,
-            "Medium": (255, 165, 0),  # Orange
-            "Hard": Config.RED
-        }
+        diff_button_width = scale_w(70)
+        diff_button_height = scale_h(30)
+        diff_button_y = difficulty_panel_y + scale_h(5)
         
         self.difficulty_buttons = {}
         for i, diff in enumerate(["Easy", "Medium", "Hard"]):
-            x_pos = difficulty_panel_x + Config.scale_width(80) + (diff_button_width + Config.scale_width(10)) * i
+            x_pos = difficulty_panel_x + scale_w(80) + (diff_button_width + scale_w(10)) * i
             
-            # Check if this is the current difficulty
+            # Full color for the current difficulty, muted otherwise
             is_selected = (diff == self.current_difficulty)
-            bg_color = diff_colors[diff]
-            # Make unselected buttons more muted
-            if not is_selected:
-                # Create a more muted version of the color
-                bg_color = tuple(min(255, c + 70) for c in bg_color)
+            bg_color = self._DIFF_COLORS[diff] if is_selected else self._DIFF_MUTED[diff]
             
             button = Button(
                 x_pos,
@@ -156,7 +192,7 @@ class DrawBasicShapes(GameState):
                 diff,
                 lambda d=diff: self._set_difficulty(d),
                 bg_color=bg_color,
-                hover_color=diff_colors[diff],
+                hover_color=self._DIFF_COLORS[diff],
                 text_color=Config.WHITE,
                 rounded=True,
                 font_size=scaled_font_sizes['small']
@@ -165,10 +201,10 @@ class DrawBasicShapes(GameState):
         
         # Calculate button positions with proper spacing to avoid overlap
         # Use a more professional layout with even margins
-        button_margin = Config.scale_width(20)
+        button_margin = scale_w(20)
         button_width = scaled_button_width * 0.85  # Slightly smaller buttons to fit 4 of them
         button_spacing = (whiteboard_width - 4 * button_width - 2 * button_margin) / 3
-        button_y = screen_height - Config.scale_height(45)  # Move up slightly
+        button_y = screen_height - scale_h(45)  # Move up slightly
         
         # Back to Menu button - leftmost
         self.menu_button = Button(
@@ -234,34 +270,56 @@ class DrawBasicShapes(GameState):
             disabled=True
         )
         
+        # Cache the canvas origin so per-event coordinate conversion skips
+        # the tuple indexing on self.whiteboard.pos
+        self._wb_x, self._wb_y = self.whiteboard.pos
+
+        # Single flat tuple so event handling and hover updates touch every
+        # button in one loop
+        self._buttons = (
+            self.menu_button,
+            self.clear_button,
+            self.random_shape_button,
+            self.next_shape_button,
+        ) + tuple(self.difficulty_buttons.values())
+
         # Calculate accuracy panel position (right side of whiteboard)
         self.accuracy_panel_pos = (
-            whiteboard_x + whiteboard_width + Config.scale_width(20),
+            whiteboard_x + whiteboard_width + scale_w(20),
             whiteboard_y
         )
         self.accuracy_panel_size = (
             accuracy_panel_width,
-            Config.scale_height(320)  # Slightly taller for more information
+            scale_h(320)  # Slightly taller for more information
         )
-        
+
+        # Pre-composite the static chrome (background fill, header bar,
+        # title, difficulty and instruction labels) once; draw() blits this
+        # single surface instead of re-painting each piece per frame. The
+        # shape label is excluded because its text changes per shape.
+        self._static_bg = pygame.Surface((screen_width, screen_height))
+        self._static_bg.fill(Config.LIGHT_GRAY)
+        pygame.draw.rect(self._static_bg, Config.BLUE, self.header_rect)
+        title_color_original = self.title_label.color
+        self.title_label.color = Config.WHITE
+        self.title_label.draw(self._static_bg)
+        self.title_label.color = title_color_original
+        self.difficulty_label.draw(self._static_bg)
+        self.instruction_label.draw(self._static_bg)
+        if pygame.display.get_surface() is not None:
+            self._static_bg = self._static_bg.convert()
+
     def _set_difficulty(self, difficulty):
         """Change the current difficulty level"""
         if difficulty in self.difficulty_settings:
             self.current_difficulty = difficulty
             
-            # Update button appearances
-            diff_colors = {
-                "Easy": Config.GREEN,
-                "Medium": (255, 165, 0),  # Orange
-                "Hard": Config.RED
-            }
-            
+            # Update button appearances from the precomputed palettes
             for diff, button in self.difficulty_buttons.items():
                 if diff == difficulty:
-                    button.bg_color = diff_colors[diff]
+                    button.bg_color = self._DIFF_COLORS[diff]
                 else:
-                    # Create a more muted version of the color
-                    button.bg_color = tuple(min(255, c + 70) for c in diff_colors[diff])
+                    button.bg_color = self._DIFF_MUTED[diff]
             
             # Reset the current shape to apply new difficulty
             self._generate_current_shape()
@@ -292,8 +350,8 @@ class DrawBasicShapes(GameState):
         # Get whiteboard dimensions
         wb_width, wb_height = self.whiteboard.size
         
-        # Create a completely new white surface
-        self.whiteboard.drawing_engine.surface = pygame.Surface((wb_width, wb_height))
+        # Reset the existing canvas in place: reallocating a Surface per
+        # shape churns the heap and discards the display-format conversion
         self.whiteboard.drawing_engine.surface.fill(Config.WHITE)
         
         # Calculate an appropriate size for the shape (based on whiteboard)
@@ -308,30 +366,60 @@ class DrawBasicShapes(GameState):
             (wb_width // 2, wb_height // 2),  # Center of whiteboard
             size
         )
-        
-        # Update shape label
+
+        # The path is constant for the lifetime of the shape, so build the
+        # target array and per-segment geometry once for every accuracy query
+        self.target_points = np.asarray(self.current_shape_points, dtype=np.float32)
+        self.shape_geometry = PathDetection.precompute_target_geometry(self.target_points)
+
+        # Update shape label (lives in the static chrome region)
         self.shape_label.text = shape_data["name"]
+        self._needs_full_redraw = True
         
         # Reset tracing state
-        self.drawn_points = []
+        self._reset_drawn_points()
+        self.point_count = 0
+        self.last_evaluation_time = 0
+        self.last_evaluation_pos = None
         self.accuracy_tracker.reset()
         self.accuracy_tracker.set_current_shape(shape_data["name"])
         self.is_tracing = False
         self.shape_completed = False
         self.next_shape_button.disabled = True
-        self.auto_progress_timer = None
-        
-        # Draw the shape outline
-        PathDetection.draw_shape_outline(
-            self.whiteboard.drawing_engine.surface,
-            self.current_shape_points,
-            Config.BLUE,
-            width=4,
-            alpha=100
-        )
-        
+        # Cancel any pending auto-progress timer from the previous shape
+        pygame.time.set_timer(AUTO_PROGRESS, 0)
+
+        # Draw the shape outline from the per-shape cache
+        self._current_outline = self._shape_outline_surface(shape_data["type"], size)
+        self.whiteboard.drawing_engine.surface.blit(self._current_outline, (0, 0))
+
+        # Keep a copy of the pristine canvas (white + outline) so Clear is
+        # a single blit instead of a fill plus outline composite
+        self._clean_bg = self.whiteboard.drawing_engine.surface.copy()
+
         # Add to drawing history
         self.whiteboard.drawing_engine._add_to_history()
+
+    def _shape_outline_surface(self, shape_type, size):
+        """
+        Return the rendered outline overlay for a shape, rasterizing it only
+        the first time a (type, size, canvas size) combination is seen.
+        """
+        wb_width, wb_height = self.whiteboard.size
+        key = (shape_type, size, (wb_width, wb_height))
+        outline = self._outline_cache.get(key)
+        if outline is None:
+            outline = pygame.Surface((wb_width, wb_height), pygame.SRCALPHA)
+            PathDetection.draw_shape_outline(
+                outline,
+                self.current_shape_points,
+                Config.BLUE,
+                width=4,
+                alpha=100
+            )
+            outline = outline.convert_alpha()
+            self._outline_cache[key] = outline
+        return outline
         
     def _request_menu_exit(self):
         """Return to main menu with confirmation if needed"""
@@ -360,33 +448,24 @@ class DrawBasicShapes(GameState):
     
     def _clear_drawing(self):
         """Clear the current drawing but keep the shape outline"""
-        # Get the current whiteboard size
-        wb_width, wb_height = self.whiteboard.size
-        
-        # Create a completely new white surface
-        self.whiteboard.drawing_engine.surface = pygame.Surface((wb_width, wb_height))
-        self.whiteboard.drawing_engine.surface.fill(Config.WHITE)
-        
+        # Restore the pristine canvas (white + outline) with a single blit
+        # onto the existing surface — no reallocation, no outline redraw
+        self.whiteboard.drawing_engine.surface.blit(self._clean_bg, (0, 0))
+
         # Reset drawn points and tracing state
-        self.drawn_points = []
+        self._reset_drawn_points()
+        self.point_count = 0
+        self.last_evaluation_time = 0
+        self.last_evaluation_pos = None
         self.is_tracing = False
-        
+
         # Reset and update the accuracy tracker
         self.accuracy_tracker.reset()
         self.accuracy_tracker.set_current_shape(self.shapes_data[self.current_shape_index]["name"])
-        
+
         # Update button state
         self.next_shape_button.disabled = not self.shape_completed
-        
-        # Redraw the shape outline
-        PathDetection.draw_shape_outline(
-            self.whiteboard.drawing_engine.surface,
-            self.current_shape_points,
-            Config.BLUE,
-            width=4,
-            alpha=100
-        )
-        
+
         # Add this clear action to the drawing history
         self.whiteboard.drawing_engine._add_to_history()
     
@@ -399,21 +478,38 @@ class DrawBasicShapes(GameState):
             
     def _random_shape(self):
         """Switch to a random shape"""
-        import random
-        
-        # Get a random shape index different from current
-        if len(self.shapes_data) > 1:
-            new_index = self.current_shape_index
-            while new_index == self.current_shape_index:
-                new_index = random.randint(0, len(self.shapes_data) - 1)
-            self.current_shape_index = new_index
-        else:
-            # If only one shape, just restart it
-            pass
-            
+        # Pick a random offset in [1, n-1] so the new index is always
+        # different from the current one, with no retry loop
+        count = len(self.shapes_data)
+        if count > 1:
+            offset = random.randint(1, count - 1)
+            self.current_shape_index = (self.current_shape_index + offset) % count
+
         # Generate the new shape with a clear whiteboard
         self._generate_current_shape()
-    
+
+    @property
+    def drawn_points(self):
+        """View of the recorded stroke as an (N, 2) float32 array"""
+        return self._drawn_buffer[:self.drawn_count]
+
+    def _reset_drawn_points(self):
+        """Empty the stroke buffer without releasing its capacity"""
+        self.drawn_count = 0
+        # Running totals for incremental evaluation: live updates only
+        # score points added since the previous pass and fold them in here
+        self._eval_index = 0
+        self._eval_on_path = 0
+        self._eval_distance_sum = 0.0
+        self._eval_max_distance = 0.0
+
+    def _append_drawn_point(self, pos):
+        """Append one canvas point, growing the buffer geometrically"""
+        if self.drawn_count == len(self._drawn_buffer):
+            self._drawn_buffer = np.resize(self._drawn_buffer, (len(self._drawn_buffer) * 2, 2))
+        self._drawn_buffer[self.drawn_count] = pos
+        self.drawn_count += 1
+
     def _evaluate_tracing(self, is_final=False):
         """
         Evaluate the tracing accuracy and update metrics
@@ -425,15 +521,14 @@ class DrawBasicShapes(GameState):
             # Not enough data to evaluate
             return
         
-        # Calculate accuracy with difficulty-based tolerance
+        # Calculate accuracy with difficulty-based tolerance. Both the live
+        # and the final pass score just the unprocessed tail and read the
+        # running totals — the tolerance is fixed for the whole stroke, so
+        # the totals are exact and a final full re-scan would only repeat
+        # the same arithmetic
         tolerance = self.difficulty_settings[self.current_difficulty]
-        
-        metrics = PathDetection.calculate_tracing_accuracy(
-            self.drawn_points,
-            self.current_shape_points,
-            tolerance=tolerance  # Use difficulty-based tolerance
-        )
-        
+        metrics = self._incremental_metrics(tolerance)
+
         # Update accuracy tracker
         self.accuracy_tracker.update_metrics(metrics)
         
@@ -447,8 +542,9 @@ class DrawBasicShapes(GameState):
                 # Show completion dialog
                 def close_dialog():
                     self.active_dialog = None
-                    # Set timer for auto-progression (3 seconds)
-                    self.auto_progress_timer = pygame.time.get_ticks() + 3000
+                    # Schedule auto-progression as a one-shot event instead
+                    # of a per-frame timestamp comparison in update()
+                    pygame.time.set_timer(AUTO_PROGRESS, 3000, loops=1)
                     
                 self.active_dialog = Dialog(
                     self.screen,
@@ -462,10 +558,30 @@ class DrawBasicShapes(GameState):
                     confirm_text="OK"
                 )
             
-    # Modify the real-time accuracy evaluation to reduce frequency
-    point_count = 0
-    last_evaluation_time = 0
-    
+    def _incremental_metrics(self, tolerance):
+        """
+        Score only the points added since the last evaluation and fold them
+        into running totals, so live feedback stays O(new points) instead of
+        re-scoring the entire stroke on every pass.
+        """
+        new_points = self.drawn_points[self._eval_index:]
+        if len(new_points) > 0:
+            distances = PathDetection.distances_to_path(
+                new_points, self.target_points, self.shape_geometry)
+            self._eval_on_path += int((distances <= tolerance).sum())
+            self._eval_distance_sum += float(distances.sum())
+            self._eval_max_distance = max(self._eval_max_distance, float(distances.max()))
+            self._eval_index = self.drawn_count
+
+        total = self._eval_index
+        return {
+            "percentage": (self._eval_on_path / total) * 100 if total else 0.0,
+            "on_path_points": self._eval_on_path,
+            "total_points": total,
+            "avg_distance": self._eval_distance_sum / total if total else float('inf'),
+            "max_distance": self._eval_max_distance
+        }
+
     def handle_event(self, event):
         """Handle pygame events"""
         # Handle dialog events first if active
@@ -477,56 +593,86 @@ class DrawBasicShapes(GameState):
         if event.type == pygame.VIDEORESIZE:
             self.handle_resize()
             return True
-        
+
+        # One-shot auto-progress timer fired after the completion dialog
+        if event.type == AUTO_PROGRESS:
+            self._next_shape()
+            return True
+
+        # Hover state is driven by motion events rather than per-frame
+        # polling, throttled so high-poll-rate mice do not multiply the work
+        if event.type == pygame.MOUSEMOTION:
+            now = self.game_manager.now_ms
+            if now - self._last_hover_ms >= 16:
+                self._last_hover_ms = now
+                self._update_hover(event.pos)
+
         # Handle button events
         button_handled = False
-        if self.menu_button.handle_event(event): button_handled = True
-        if self.clear_button.handle_event(event): button_handled = True
-        if self.random_shape_button.handle_event(event): button_handled = True
-        if self.next_shape_button.handle_event(event): button_handled = True
-        for button in self.difficulty_buttons.values():
+        for button in self._buttons:
             if button.handle_event(event): button_handled = True
-        
+
         if button_handled: return True
         
-        # Handle drawing events
-        canvas_rect = pygame.Rect(
-            self.whiteboard.pos[0], 
-            self.whiteboard.pos[1], 
-            self.whiteboard.size[0], 
-            self.whiteboard.size[1]
-        )
+        # Handle drawing events against the whiteboard's cached hit rect
+        # instead of constructing a new Rect per event
+        canvas_rect = self.whiteboard.canvas_rect
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
             if canvas_rect.collidepoint(event.pos):
                 # Convert screen coordinates to canvas coordinates
                 canvas_pos = (
-                    event.pos[0] - self.whiteboard.pos[0], 
-                    event.pos[1] - self.whiteboard.pos[1]
+                    event.pos[0] - self._wb_x,
+                    event.pos[1] - self._wb_y
                 )
                 self.whiteboard.drawing_engine.start_drawing(canvas_pos)
                 self.is_tracing = True
-                self.drawn_points = [canvas_pos]  # Start tracking points
+                self._reset_drawn_points()  # Start tracking points
+                self._append_drawn_point(canvas_pos)
                 self.point_count = 1
-                self.last_evaluation_time = pygame.time.get_ticks()
+                self.last_evaluation_time = self.game_manager.now_ms
+                self.last_evaluation_pos = canvas_pos
                 
         elif event.type == pygame.MOUSEMOTION:
             if self.whiteboard.drawing_engine.is_drawing and canvas_rect.collidepoint(event.pos):
                 # Convert screen coordinates to canvas coordinates
                 canvas_pos = (
-                    event.pos[0] - self.whiteboard.pos[0], 
-                    event.pos[1] - self.whiteboard.pos[1]
+                    event.pos[0] - self._wb_x,
+                    event.pos[1] - self._wb_y
                 )
                 self.whiteboard.drawing_engine.draw_to(canvas_pos)
-                self.drawn_points.append(canvas_pos)  # Track point for accuracy
+
+                # Cull near-duplicate samples: always draw so the line stays
+                # smooth, but only store a point for accuracy once it is
+                # ~2 px away from the last stored one — clustered samples
+                # add work to every evaluation without changing the metrics
+                if self.drawn_count:
+                    last_x, last_y = self._drawn_buffer[self.drawn_count - 1]
+                    dx = canvas_pos[0] - last_x
+                    dy = canvas_pos[1] - last_y
+                    if dx * dx + dy * dy < 4.0:
+                        return True
+                self._append_drawn_point(canvas_pos)  # Track point for accuracy
                 self.point_count += 1
                 
-                # Only update accuracy every 10 points or after 100ms to reduce performance impact
-                current_time = pygame.time.get_ticks()
-                if (self.point_count >= 10 or (current_time - self.last_evaluation_time) > 100):
+                # Only update accuracy every 10 points or after 100ms to
+                # reduce performance impact (one tick read per event batch,
+                # set by the main loop), and only once the cursor has moved
+                # a few pixels from where it was last scored — a stationary
+                # or slow-moving cursor cannot change the metrics
+                current_time = self.game_manager.now_ms
+                last_pos = self.last_evaluation_pos
+                moved_enough = (
+                    last_pos is None
+                    or abs(canvas_pos[0] - last_pos[0])
+                    + abs(canvas_pos[1] - last_pos[1]) >= 4
+                )
+                if moved_enough and (self.point_count >= 10
+                        or (current_time - self.last_evaluation_time) > 100):
                     self._evaluate_tracing(is_final=False)
                     self.point_count = 0
                     self.last_evaluation_time = current_time
+                    self.last_evaluation_pos = canvas_pos
                 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:  # Left release
             if self.whiteboard.drawing_engine.is_drawing:
@@ -539,27 +685,23 @@ class DrawBasicShapes(GameState):
         
         return False
 
+    def _update_hover(self, mouse_pos):
+        """Refresh hover state for all interactive elements in one pass"""
+        if self.active_dialog:
+            # The dialog is modal: the buttons underneath cannot be hovered
+            # or clicked, so skip their updates entirely
+            self.active_dialog.update(mouse_pos)
+        else:
+            for button in self._buttons:
+                button.update(mouse_pos)
+
     def update(self, dt):
         """Update game state"""
-        mouse_pos = pygame.mouse.get_pos()
-        self.menu_button.update(mouse_pos)
-        self.clear_button.update(mouse_pos)
-        self.random_shape_button.update(mouse_pos)
-        self.next_shape_button.update(mouse_pos)
-        
-        # Update difficulty buttons
-        for button in self.difficulty_buttons.values():
-            button.update(mouse_pos)
-        
-        # Update dialog if active
-        if self.active_dialog and mouse_pos:
-            self.active_dialog.update(mouse_pos)
-            
-        # Check for auto-progression timer
-        if self.auto_progress_timer and pygame.time.get_ticks() > self.auto_progress_timer:
-            self.auto_progress_timer = None
-            self._next_shape()  # Automatically progress to next shape
-            
+        # Apply at most one deferred resize per frame, no matter how many
+        # VIDEORESIZE events arrived during a live window drag
+        if self._pending_resize:
+            self._apply_resize()
+
         # Handle state transitions - Return state name string
         if self.request_menu_exit:
              self.request_menu_exit = False # Reset flag
@@ -568,32 +710,30 @@ class DrawBasicShapes(GameState):
         return None # No state change
 
     def draw(self):
-        """Render the game"""
-        self.screen.fill(Config.LIGHT_GRAY)
-        
-        # Draw header bar
-        pygame.draw.rect(self.screen, Config.BLUE, self.header_rect)
-        
-        # Draw title
-        title_color_original = self.title_label.color
-        self.title_label.color = Config.WHITE
-        self.title_label.draw(self.screen)
-        self.title_label.color = title_color_original
-        
-        # Draw difficulty selector
-        self.difficulty_label.draw(self.screen)
-        for button in self.difficulty_buttons.values():
-            button.draw(self.screen)
-        
-        # Draw shape label
-        self.shape_label.draw(self.screen)
-        
-        # Draw instruction label
-        self.instruction_label.draw(self.screen)
-        
+        """
+        Render the game.
+
+        Returns a list of dirty rects when only the dynamic regions changed,
+        or None to request a full display flip.
+        """
+        dialog_active = self.active_dialog is not None
+        full_redraw = self._needs_full_redraw or dialog_active or self._dialog_was_active
+        self._dialog_was_active = dialog_active
+
+        if full_redraw:
+            self._needs_full_redraw = False
+
+            # Static chrome (background, header, title, difficulty and
+            # instruction labels) pre-composited in _setup_ui
+            self.screen.blit(self._static_bg, (0, 0))
+
+            # Draw shape label (changes with the current shape, which also
+            # flags a full redraw)
+            self.shape_label.draw(self.screen)
+
         # Draw whiteboard using its render method
-        self.whiteboard.render()
-        
+        dirty_rects = [self.whiteboard.render()]
+
         # Draw accuracy panel
         self.accuracy_tracker.draw_accuracy_panel(
             self.screen,
@@ -601,31 +741,45 @@ class DrawBasicShapes(GameState):
             self.accuracy_panel_size,
             show_details=True
         )
-        
-        # Draw buttons
-        self.menu_button.draw(self.screen)
-        self.clear_button.draw(self.screen)
-        self.random_shape_button.draw(self.screen)
-        self.next_shape_button.draw(self.screen)
-        
+        dirty_rects.append(pygame.Rect(self.accuracy_panel_pos, self.accuracy_panel_size))
+
+        # Draw difficulty buttons in one batched blit
+        difficulty_buttons = tuple(self.difficulty_buttons.values())
+        Button.draw_group(self.screen, difficulty_buttons)
+        dirty_rects.extend(button.rect for button in difficulty_buttons)
+
+        # Draw control buttons in one batched blit
+        control_buttons = (
+            self.menu_button,
+            self.clear_button,
+            self.random_shape_button,
+            self.next_shape_button
+        )
+        Button.draw_group(self.screen, control_buttons)
+        dirty_rects.extend(button.rect for button in control_buttons)
+
         # Draw dialog if active
         if self.active_dialog:
             self.active_dialog.draw()
+
+        # A full repaint needs a full flip; otherwise only the dynamic
+        # regions were touched
+        return None if full_redraw else dirty_rects
         
     def handle_resize(self):
-         # Recalculate layout and re-setup UI
-         # self._calculate_layout() # Remove call if method is removed
+         # Coalesce resize storms: just mark the rebuild as pending and let
+         # update() apply it once per frame
+         self._pending_resize = True
+
+    def _apply_resize(self):
+         """Rebuild the UI and shape for the current window size."""
+         self._pending_resize = False
          self._setup_ui()
+         # Outlines rendered for the old canvas size can never be reused
+         self._outline_cache.clear()
          self._generate_current_shape() # Regenerate shape
          
     def _go_back(self):
         # This method is likely called by the back button
         # Check if content exists before setting flag
         self._request_menu_exit()
-
-    # Remove the duplicate/empty method definitions below
-    # def _calculate_layout(self):
-    #     pass
-        
-    # def _setup_ui(self):
-    #     pass 
\ No newline at end of file
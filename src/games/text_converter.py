@@ -1,9 +1,19 @@
 import pygame
+# tesserocr keeps the Tesseract engine (and its language models) resident
+# in-process, while pytesseract spawns a tesseract subprocess per call.
+# Prefer the former when installed, fall back to the latter otherwise.
+try:
+    from tesserocr import PyTessBaseAPI, PSM
+    _HAS_TESSEROCR = True
+except ImportError:
+    _HAS_TESSEROCR = False
 import pytesseract
 import pyperclip
+import numpy as np
 from PIL import Image
 import io
 import threading # Import threading
+import queue
 
 from src.core.game_state import GameState
 from src.core.whiteboard import Whiteboard
@@ -14,6 +24,10 @@ from src.config import Config
 OCR_COMPLETE = pygame.USEREVENT + 1
 
 class TextConverterGame(GameState):
+    # Quiet period after the last stroke before OCR fires, so multi-stroke
+    # writing triggers one recognition per pause instead of one per stroke
+    OCR_QUIET_MS = 400
+
     def __init__(self, screen, game_manager):
         super().__init__(screen, game_manager)
         # Define position and size as tuples
@@ -29,6 +43,30 @@ class TextConverterGame(GameState):
         self.font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 32)
         self.processing = False # Flag to indicate OCR is running
+        self._ocr_pending = False # A stroke finished and awaits recognition
+        self._last_stroke_time = 0
+
+        # Wrapped-text cache: the display text changes only on OCR
+        # completion or Clear, so re-measuring and re-rendering it at
+        # 60 Hz is pure waste. Keyed by (text, box width)
+        self._wrap_key = None
+        self._line_surfaces = []
+        self._word_widths = {}  # font.size() results per distinct word
+
+        # Long-lived Tesseract API instance (tesserocr only), created once
+        # so each recognition skips the per-call process spawn and model
+        # load that dominate pytesseract's latency
+        self._tess_api = None
+        self._tess_lock = threading.Lock()
+        if _HAS_TESSEROCR:
+            self._tess_api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, lang='eng')
+
+        # One persistent worker consumes canvases from a single-slot queue,
+        # so recognition never pays thread startup and a stale canvas still
+        # waiting in the slot is simply replaced by a fresher one
+        self._ocr_queue = queue.Queue(maxsize=1)
+        self._ocr_worker = threading.Thread(target=self._ocr_loop, daemon=True)
+        self._ocr_worker.start()
 
         # Tesseract path might need configuration depending on the system
         # Uncomment and set path if necessary:
@@ -57,18 +95,24 @@ class TextConverterGame(GameState):
         # Always handle whiteboard events (drawing should not be blocked)
         whiteboard_handled = self.whiteboard.handle_event(event)
 
-        # Trigger OCR *only* if drawing stopped AND OCR is not already processing
+        # Don't OCR immediately on release: note the stroke end and let
+        # update() fire recognition once the pen has been quiet for a bit.
+        # If a recognition is already running, the pending flag makes a
+        # fresh one start from the final canvas as soon as it completes.
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if whiteboard_handled and not self.whiteboard.drawing_engine.is_drawing: 
-                if not self.processing: # Only start if not already processing
-                    self.recognize_drawing() 
-                else:
-                     print("OCR already in progress, skipping new request.") # Optional debug msg
+            if whiteboard_handled and not self.whiteboard.drawing_engine.is_drawing:
+                self._ocr_pending = True
+                self._last_stroke_time = self.game_manager.now_ms
 
         return whiteboard_handled # Return True if whiteboard handled the event
 
     def update(self, dt):
         self.whiteboard.update(dt)
+        # Fire the debounced recognition once the quiet period has elapsed
+        if (self._ocr_pending and not self.processing
+                and self.game_manager.now_ms - self._last_stroke_time >= self.OCR_QUIET_MS):
+            self._ocr_pending = False
+            self.recognize_drawing()
         # Get mouse position for UI elements
         mouse_pos = pygame.mouse.get_pos()
         self.copy_button.update(mouse_pos)
@@ -89,15 +133,21 @@ class TextConverterGame(GameState):
         if self.processing: 
              display_text = "Processing..."
 
-        # Wrap and render the text (result, error, or processing indicator)
-        lines = self.wrap_text(display_text, self.font, self.text_display_rect.width - 20) # Use helper
+        # Wrap and render the text (result, error, or processing indicator),
+        # reusing the cached line surfaces while the text is unchanged
+        wrap_key = (display_text, self.text_display_rect.width)
+        if wrap_key != self._wrap_key:
+            self._wrap_key = wrap_key
+            lines = self.wrap_text(display_text, self.font, self.text_display_rect.width - 20) # Use helper
+            self._line_surfaces = [self.font.render(line, True, Config.BLACK) for line in lines]
+
+        line_height = self.font.get_linesize()
         y_offset = self.text_display_rect.y + 10
-        for line in lines:
-             text_surface = self.font.render(line, True, Config.BLACK)
+        for text_surface in self._line_surfaces:
              # Ensure text stays within the display rect vertically
-             if y_offset + self.font.get_linesize() <= self.text_display_rect.bottom - 10:
+             if y_offset + line_height <= self.text_display_rect.bottom - 10:
                   self.screen.blit(text_surface, (self.text_display_rect.x + 10, y_offset))
-                  y_offset += self.font.get_linesize()
+                  y_offset += line_height
              else:
                   break # Stop drawing lines if they overflow the box
 
@@ -117,18 +167,60 @@ class TextConverterGame(GameState):
         """Function to run OCR in a background thread."""
         ocr_result = ""
         try:
-            # Convert Pygame surface to PIL Image
-            img_str = pygame.image.tostring(surface_copy, 'RGB')
-            img_pil = Image.frombytes('RGB', surface_copy.get_size(), img_str)
-
-            # Perform OCR
-            recognized = pytesseract.image_to_string(img_pil, config='--psm 6').strip()
-            
-            if not recognized:
-                 ocr_result = "(No text detected)"
+            # Crop to the tight bounding box of the ink before recognizing:
+            # OCR runtime scales with pixel count and the canvas is mostly
+            # white, so feeding the full surface wastes most of the work
+            arr = pygame.surfarray.array3d(surface_copy)  # (width, height, 3)
+            mask = (arr != 255).any(axis=2)
+            xs = np.flatnonzero(mask.any(axis=1))
+            ys = np.flatnonzero(mask.any(axis=0))
+
+            if len(xs) == 0:
+                # Nothing drawn at all; skip Tesseract entirely
+                ocr_result = "(No text detected)"
             else:
-                 ocr_result = recognized
-                 
+                pad = 10  # Keep a little white margin around the ink
+                x0 = max(int(xs[0]) - pad, 0)
+                x1 = min(int(xs[-1]) + pad + 1, arr.shape[0])
+                y0 = max(int(ys[0]) - pad, 0)
+                y1 = min(int(ys[-1]) + pad + 1, arr.shape[1])
+
+                # pygame's surfarray is (width, height); PIL wants rows first
+                img_pil = Image.fromarray(arr[x0:x1, y0:y1].transpose(1, 0, 2))
+
+                # Downscale oversized crops; Tesseract gains nothing from
+                # canvas-resolution line art
+                max_side = 1024
+                if max(img_pil.size) > max_side:
+                    scale = max_side / max(img_pil.size)
+                    img_pil = img_pil.resize(
+                        (max(1, int(img_pil.width * scale)),
+                         max(1, int(img_pil.height * scale))),
+                        Image.LANCZOS
+                    )
+
+                # Grayscale and binarize ourselves instead of letting
+                # Tesseract convert internally — a third of the bandwidth
+                # into the OCR pipeline and a more stable threshold
+                img_pil = img_pil.convert('L').point(
+                    lambda p: 0 if p < 200 else 255, mode='1')
+
+                # Perform OCR via the persistent API when available
+                if self._tess_api is not None:
+                    # Serialize access to the shared engine; processing
+                    # already limits us to one OCR thread, the lock guards
+                    # against exit() tearing the API down mid-recognition
+                    with self._tess_lock:
+                        self._tess_api.SetImage(img_pil)
+                        recognized = self._tess_api.GetUTF8Text().strip()
+                else:
+                    recognized = pytesseract.image_to_string(img_pil, config='--psm 6').strip()
+
+                if not recognized:
+                     ocr_result = "(No text detected)"
+                else:
+                     ocr_result = recognized
+
             print(f"OCR Thread Recognized Text: {ocr_result}") # For debugging
 
         except pytesseract.TesseractNotFoundError:
@@ -141,6 +233,14 @@ class TextConverterGame(GameState):
             # Post custom event with the result
             pygame.event.post(pygame.event.Event(OCR_COMPLETE, {'result': ocr_result}))
 
+    def _ocr_loop(self):
+        """Worker loop: recognize canvases queued by recognize_drawing."""
+        while True:
+            surface_copy = self._ocr_queue.get()
+            if surface_copy is None:  # Sentinel posted by exit()
+                break
+            self._perform_ocr(surface_copy)
+
     def recognize_drawing(self):
         if self.processing: # Prevent overlapping calls
              return
@@ -148,16 +248,36 @@ class TextConverterGame(GameState):
         self.processing = True
         self.recognized_text = "Processing..." # Set indicator text
 
-        # Get a *copy* of the surface to pass to the thread
+        # Get a *copy* of the surface to pass to the worker
         # This avoids potential issues with the main thread modifying the surface
         surface_to_process = self.whiteboard.drawing_engine.surface.copy()
 
-        # Create and start the OCR thread
-        ocr_thread = threading.Thread(target=self._perform_ocr, args=(surface_to_process,))
-        ocr_thread.start()
-        # We don't join() the thread here, as that would block
+        # Hand it to the persistent worker, replacing any stale canvas
+        # still sitting in the slot so only the freshest image is processed
+        try:
+            self._ocr_queue.put_nowait(surface_to_process)
+        except queue.Full:
+            try:
+                self._ocr_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._ocr_queue.put_nowait(surface_to_process)
+        # We don't block on the worker here
         # The result will come back via the OCR_COMPLETE event
 
+    def exit(self):
+        """Optional state cleanup hook: stop the worker and release the engine."""
+        # Drop anything queued and wake the worker with the stop sentinel
+        try:
+            self._ocr_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._ocr_queue.put_nowait(None)
+        if self._tess_api is not None:
+            with self._tess_lock:
+                self._tess_api.End()
+                self._tess_api = None
+
     def copy_text(self):
         # Only copy if not processing and text is not an error/indicator message
         if not self.processing and self.recognized_text and not self.recognized_text.startswith("OCR Error") and not self.recognized_text.startswith("("):
@@ -183,27 +303,42 @@ class TextConverterGame(GameState):
         
         self.recognized_text = "" # Clear the text display
         self.processing = False # Ensure processing stops if clear is hit mid-process
+        self._ocr_pending = False # Drop any recognition queued behind the cleared canvas
 
     # Helper function for text wrapping (add this method to the class)
     def wrap_text(self, text, font, max_width):
-        words = text.split(' ')
+        """
+        Greedy word wrap in a single pass: each distinct word is measured
+        once (widths memoized across calls) and line widths are tracked by
+        integer addition, instead of re-measuring the growing line string
+        for every word.
+        """
+        word_widths = self._word_widths
+        space_width = font.size(' ')[0]
         lines = []
-        current_line = ""
-        for word in words:
+        current_words = []
+        current_width = 0
+        for word in text.split(' '):
             # Handle potential newlines within the text itself
             sub_words = word.split('\n')
             for i, sub_word in enumerate(sub_words):
-                test_line = current_line + sub_word + " "
-                # Check width
-                if font.size(test_line.strip())[0] <= max_width:
-                    current_line = test_line
+                if i > 0:
+                    # Explicit newline: force a break before this sub_word
+                    lines.append(' '.join(current_words))
+                    current_words = []
+                    current_width = 0
+                width = word_widths.get(sub_word)
+                if width is None:
+                    width = word_widths[sub_word] = font.size(sub_word)[0]
+                test_width = current_width + space_width + width if current_words else width
+                if test_width <= max_width or not current_words:
+                    # Fits (or is an overlong word alone on its line)
+                    current_words.append(sub_word)
+                    current_width = test_width
                 else:
                     # Word doesn't fit, start new line
-                    lines.append(current_line.strip())
-                    current_line = sub_word + " "
-                # If there was a newline, force a line break after the sub_word
-                if i < len(sub_words) - 1:
-                     lines.append(current_line.strip())
-                     current_line = "" 
-        lines.append(current_line.strip())
+                    lines.append(' '.join(current_words))
+                    current_words = [sub_word]
+                    current_width = width
+        lines.append(' '.join(current_words))
         return lines 
\ No newline at end of file
@@ -27,6 +27,9 @@ class GameStateManager:
         self.states = {}
         self.active_state_name = None
         self.active_state = None
+        # Millisecond timestamp refreshed once per loop iteration so states
+        # do not each call pygame.time.get_ticks() per event
+        self.now_ms = pygame.time.get_ticks()
         self._register_states()
 
     def _register_states(self):
@@ -86,8 +89,10 @@ class GameStateManager:
     
     def draw(self):
         if self.active_state:
-            # Call the active state's draw method
-            self.active_state.draw()
+            # Call the active state's draw method; states may return a list
+            # of dirty rects to request a partial display update
+            return self.active_state.draw()
+        return None
             
     def handle_resize(self):
         if self.active_state:
@@ -98,6 +103,11 @@ class GameStateManager:
                 # Default behavior: try to recreate the state
                 print(f"Recreating state {self.active_state_name} after resize (default behavior).")
                 try:
+                    # Release persistent resources (worker threads, OCR
+                    # engine) before dropping the old instance, just like
+                    # change_state does
+                    if hasattr(self.active_state, 'exit'):
+                        self.active_state.exit()
                     # Attempt to get constructor args if stored (requires states to store them)
                     current_args = getattr(self.active_state, '_init_args', ()) 
                     current_kwargs = getattr(self.active_state, '_init_kwargs', {})
@@ -170,8 +180,9 @@ def main():
     # Main game loop
     running = True
     while running:
-        # Event handling
+        # Event handling; one tick read covers the whole event batch
         events = pygame.event.get()
+        game_manager.now_ms = pygame.time.get_ticks()
         for event in events:
             if event.type == QUIT:
                 running = False
@@ -202,10 +213,13 @@ def main():
         game_manager.update(dt)
         
         # Render current screen via game manager
-        game_manager.draw()
-        
-        # Update display
-        pygame.display.flip()
+        dirty_rects = game_manager.draw()
+
+        # Update display - only the dirty regions when the state reports them
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
         
     # Clean up
     pygame.quit()
@@ -10,12 +10,17 @@ class AccuracyTracker:
     
     def __init__(self):
         """Initialize the accuracy tracker with default values."""
+        # Cached rendering of the panel; re-rendered only when the metrics
+        # change or an animation is in progress
+        self._panel_surface = None
+        self._dirty = True
         self.reset()
         self.last_update_time = 0  # For animations
         self.current_shape_name = "Shape"  # Default shape name
-        
+
     def reset(self):
         """Reset all tracking metrics."""
+        self._dirty = True
         self.metrics = {
             "percentage": 0.0,
             "on_path_points": 0,
@@ -32,7 +37,8 @@ class AccuracyTracker:
     def set_current_shape(self, shape_name: str):
         """Set the current shape name for display in the accuracy panel."""
         self.current_shape_name = shape_name
-        
+        self._dirty = True
+
     def update_metrics(self, metrics: Dict[str, Any]):
         """
         Update the accuracy metrics.
@@ -42,7 +48,8 @@ class AccuracyTracker:
         """
         # Save previous value for animation
         self.prev_percentage = self.metrics["percentage"]
-        
+        self._dirty = True
+
         # Update metrics
         self.metrics.update(metrics)
         self.animation_progress = 0.0  # Reset animation progress
@@ -121,23 +128,43 @@ class AccuracyTracker:
             size: (width, height) size of the panel
             show_details: Whether to show detailed metrics or just summary
         """
-        x, y = position
         width, height = size
-        
+
         # Update animation progress (smooth transitions)
         current_time = pygame.time.get_ticks()
-        if self.animation_progress < 1.0:
+        animating = self.animation_progress < 1.0
+        if animating:
             time_since_update = (current_time - self.last_update_time) / 1000.0  # seconds
             self.animation_progress = min(1.0, self.animation_progress + time_since_update * 3.0)  # Animate over ~0.33 seconds
-        
+
+        # Re-render only when something changed or an animation is running
+        # (the completed pulse keeps animating until the next shape); the
+        # steady state is a single blit of the cached panel
+        if (self._dirty or animating or self.metrics["completed"]
+                or self._panel_surface is None
+                or self._panel_surface.get_size() != size):
+            self._render_panel(size, show_details, current_time)
+            self._dirty = False
+
+        surface.blit(self._panel_surface, position)
+
+    def _render_panel(self, size: Tuple[int, int], show_details: bool, current_time: int):
+        """Render the full panel into the cached surface."""
+        width, height = size
+        x = y = 0
+        surface = self._panel_surface
+        if surface is None or surface.get_size() != size:
+            surface = pygame.Surface(size)
+            self._panel_surface = surface
+
         # Calculate interpolated percentage for smooth animation
         display_percentage = self.prev_percentage + (self.metrics["percentage"] - self.prev_percentage) * self.animation_progress
-        
+
         # Draw panel background with slight gradient
         panel_rect = pygame.Rect(x, y, width, height)
         pygame.draw.rect(surface, Config.WHITE, panel_rect)
         pygame.draw.rect(surface, Config.BLACK, panel_rect, 2)
-        
+
         # Add subtle gradient background based on completion percentage
         if display_percentage > 0:
             gradient_color = self._get_grade_color(self.get_grade(), alpha=30)
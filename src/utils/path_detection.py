@@ -99,9 +99,56 @@ class PathDetection:
         return math.sqrt(dx*dx + dy*dy)
     
     @staticmethod
-    def calculate_tracing_accuracy(drawn_path: List[Tuple[int, int]], 
+    def precompute_target_geometry(target_path: List[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Precompute per-segment geometry for repeated accuracy queries
+        against the same target path.
+
+        Args:
+            target_path: List of (x, y) coordinates defining the path
+
+        Returns:
+            Opaque (starts, deltas, len_sq) tuple that can be passed to
+            calculate_tracing_accuracy via its geometry argument
+        """
+        starts = np.asarray(target_path, dtype=np.float32)
+        deltas = np.roll(starts, -1, axis=0) - starts
+        len_sq = np.maximum((deltas * deltas).sum(axis=1), 1e-6)
+        return starts, deltas, len_sq
+
+    @staticmethod
+    def distances_to_path(points: np.ndarray, target_path: List[Tuple[int, int]],
+                           geometry: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """
+        Vectorized minimum distance from each point to a target path.
+
+        Args:
+            points: (N, 2) float array of drawn points
+            target_path: List of (x, y) coordinates defining the path,
+                treated as a closed polyline (matching calculate_distance_to_shape)
+            geometry: Optional precomputed result of precompute_target_geometry,
+                so the per-segment setup is not repeated on every call
+
+        Returns:
+            (N,) array of minimum distances, one per point
+        """
+        if geometry is None:
+            geometry = PathDetection.precompute_target_geometry(target_path)
+        starts, deltas, len_sq = geometry
+
+        # Project every point onto every segment in one broadcast pass
+        diff = points[:, None, :] - starts[None, :, :]            # (N, M, 2)
+        t = (diff * deltas[None, :, :]).sum(axis=2) / len_sq      # (N, M)
+        np.clip(t, 0.0, 1.0, out=t)
+        offset = diff - t[:, :, None] * deltas[None, :, :]
+        dist_sq = (offset * offset).sum(axis=2)
+        return np.sqrt(dist_sq.min(axis=1))
+
+    @staticmethod
+    def calculate_tracing_accuracy(drawn_path: List[Tuple[int, int]],
                                   target_path: List[Tuple[int, int]],
-                                  tolerance: int = 10) -> Dict[str, Any]:
+                                  tolerance: int = 10,
+                                  geometry: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> Dict[str, Any]:
         """
         Calculate the accuracy of a drawn path compared to a target path.
         
@@ -109,7 +156,9 @@ class PathDetection:
             drawn_path: List of (x, y) coordinates representing the user's drawn path
             target_path: List of (x, y) coordinates representing the target path
             tolerance: Maximum distance (in pixels) for a point to be considered "on path"
-            
+            geometry: Optional precomputed result of precompute_target_geometry
+                for target_path, to skip the per-call segment setup
+
         Returns:
             Dictionary containing accuracy metrics:
                 - percentage: Overall accuracy percentage (0-100)
@@ -118,41 +167,30 @@ class PathDetection:
                 - avg_distance: Average distance from drawn points to target path
                 - max_distance: Maximum distance from any drawn point to target path
         """
-        if not drawn_path or not target_path:
+        if len(drawn_path) == 0 or len(target_path) == 0:
             return {
                 "percentage": 0.0,
                 "on_path_points": 0,
-                "total_points": len(drawn_path) if drawn_path else 0,
+                "total_points": len(drawn_path),
                 "avg_distance": float('inf'),
                 "max_distance": float('inf')
             }
-        
+
         # Optimize by sampling drawn points if there are too many
         # For real-time feedback, we don't need to process every point
         sample_drawn_path = drawn_path
         if len(drawn_path) > 50:  # If more than 50 points, sample
             stride = len(drawn_path) // 50 + 1
             sample_drawn_path = drawn_path[::stride]
-            
-        # Cache target_path as tuple for using in distance calculations
-        target_path_tuple = tuple(target_path)
-        
-        # Calculate distances from each drawn point to the target path
-        distances = []
-        on_path_count = 0
-        max_distance = 0
-        
-        distance_sum = 0
-        
-        for point in sample_drawn_path:
-            dist = PathDetection.calculate_distance_to_shape(point, target_path)
-            distance_sum += dist
-            
-            if dist <= tolerance:
-                on_path_count += 1
-                
-            max_distance = max(max_distance, dist)
-        
+
+        # Vectorized distances from every sampled point to the target path
+        sample_points = np.asarray(sample_drawn_path, dtype=np.float32)
+        distances = PathDetection.distances_to_path(sample_points, target_path, geometry)
+
+        on_path_count = int((distances <= tolerance).sum())
+        max_distance = float(distances.max())
+        distance_sum = float(distances.sum())
+
         # Calculate metrics
         sample_total = len(sample_drawn_path)
         total_points = len(drawn_path)
@@ -173,7 +211,56 @@ class PathDetection:
         }
     
     @staticmethod
-    def generate_shape_path(shape_type: str, center: Tuple[int, int], size: int, 
+    def simplify_path(points: List[Tuple[int, int]], epsilon: float = 2.0) -> List[Tuple[int, int]]:
+        """
+        Decimate a drawn path with the Ramer-Douglas-Peucker algorithm.
+
+        Points that deviate less than epsilon pixels from the line between
+        their neighbours carry no extra shape information, so dropping them
+        shrinks the evaluation workload without changing the geometry.
+
+        Args:
+            points: List of (x, y) coordinates of the drawn path
+            epsilon: Maximum deviation (in pixels) a removed point may have
+
+        Returns:
+            The decimated list of points, preserving the original entries
+        """
+        if len(points) < 3:
+            return list(points)
+
+        pts = np.asarray(points, dtype=np.float32)
+        keep = np.zeros(len(pts), dtype=bool)
+        keep[0] = keep[-1] = True
+
+        # Iterative RDP to avoid recursion limits on very long strokes
+        stack = [(0, len(pts) - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+
+            seg = pts[end] - pts[start]
+            seg_len = math.hypot(float(seg[0]), float(seg[1]))
+            chord = pts[start + 1:end] - pts[start]
+            if seg_len < 1e-6:
+                # Degenerate segment: use plain distance to the start point
+                deviations = np.sqrt((chord * chord).sum(axis=1))
+            else:
+                # Perpendicular distance via the cross product
+                deviations = np.abs(chord[:, 0] * seg[1] - chord[:, 1] * seg[0]) / seg_len
+
+            farthest = int(deviations.argmax())
+            if deviations[farthest] > epsilon:
+                split = start + 1 + farthest
+                keep[split] = True
+                stack.append((start, split))
+                stack.append((split, end))
+
+        return [points[i] for i in np.flatnonzero(keep)]
+
+    @staticmethod
+    def generate_shape_path(shape_type: str, center: Tuple[int, int], size: int,
                            num_points: int = 64) -> List[Tuple[int, int]]:
         """
         Generate a path of points that define a standard shape.
@@ -102,14 +102,20 @@ class TextPathGenerator:
         """
         # Create a temporary surface for alpha blending
         temp_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        
-        # Draw each path
-        for path in paths:
-            if len(path) < 2:
-                continue
-                
-            # Draw the path
-            pygame.draw.lines(temp_surface, (*color, alpha), False, path, width)
-        
+
+        # Lock once around the whole batch so each draw call does not pay
+        # its own surface lock/unlock round trip
+        temp_surface.lock()
+        try:
+            # Draw each path
+            for path in paths:
+                if len(path) < 2:
+                    continue
+
+                # Draw the path
+                pygame.draw.lines(temp_surface, (*color, alpha), False, path, width)
+        finally:
+            temp_surface.unlock()
+
         # Blit the temporary surface onto the main surface
         surface.blit(temp_surface, (0, 0)) 
\ No newline at end of file